@@ -0,0 +1,146 @@
+# Copyright (c) 2014-2024 Zuru Tech HK Limited, All rights reserved.
+
+"""Change-set provider shared by the hooks to process only the paths touched by a commit range"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+from collections.abc import Iterator
+
+FROM_REF_HELP = "Process only the files changed since this ref (eg: the merge-base)"
+TO_REF_HELP = (
+    "End of the commit range used with --from-ref, must be the checked out commit"
+    " (default: HEAD)"
+)
+RANGE_OPTIONS = ("--from-ref", "--to-ref")
+
+
+def parse_arguments(
+    argv: list[str], options: tuple[str, ...] = RANGE_OPTIONS
+) -> tuple[list[str], dict[str, str | None]]:
+    """
+    Split the hook arguments without argparse, to keep the no-op path cheap
+    Options not listed in options are ignored, as the hooks always did
+    :return: the file names and the value of each option (None if missing)
+    """
+    filenames = []
+    values: dict[str, str | None] = {name: None for name in options}
+
+    args = iter(argv)
+    for arg in args:
+        name, separator, value = arg.partition("=")
+        if name in values:
+            option = value if separator else next(args, "")
+            if not option:
+                print(f"ERROR: {name} expects a value", file=sys.stderr)
+                sys.exit(1)
+            values[name] = option
+        elif not arg.startswith("-"):
+            filenames.append(arg)
+
+    if values.get("--to-ref") is not None and values.get("--from-ref") is None:
+        print("ERROR: --to-ref requires --from-ref", file=sys.stderr)
+        sys.exit(1)
+    return filenames, values
+
+
+def get_hook_files(argv: list[str], files_regex: str) -> list[str]:
+    """
+    Returns the files passed to the hook,
+    plus the ones matching files_regex changed in the --from-ref/--to-ref range
+    """
+    filenames, values = parse_arguments(argv)
+    changed = get_changed_files(
+        values["--from-ref"], values["--to-ref"] or "HEAD", files_regex=files_regex
+    )
+    if changed is not None:
+        filenames.extend(changed)
+    return filenames
+
+
+def get_git_cdup() -> str:
+    """Returns the path of the git root relative to the current directory"""
+    return _git(["rev-parse", "--show-cdup"], "Not in a git repository").rstrip("\n")
+
+
+def iter_changed_files(
+    from_ref: str,
+    to_ref: str = "HEAD",
+    skip_deleted: bool = True,
+    skip_binary: bool = True,
+    files_regex: str | None = None,
+) -> Iterator[str]:
+    """
+    Yield the paths changed between from_ref and to_ref, relative to the current dir
+    The hooks read the working tree, so to_ref must be the checked out commit
+    :param skip_deleted: If true, paths removed in the range are not returned
+    :param skip_binary: If true, paths that git detects as binary are not returned
+    :param files_regex: If set, only the paths matching it (from the git root) are returned
+    """
+    # One call gives the path to the git root and validates to_ref against HEAD
+    cdup, head, to_commit = _git(
+        ["rev-parse", "--show-cdup", "HEAD", f"{to_ref}^{{commit}}"],
+        f"Invalid ref '{to_ref}'",
+    ).split("\n")[:3]
+    if head != to_commit:
+        print(
+            f"ERROR: --to-ref '{to_ref}' is not the checked out commit",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    # --numstat reports binary files as "-\t-" but computes the line counts of every
+    # file, so it is used only when binary files have to be filtered
+    args = ["diff", "-z", "--numstat" if skip_binary else "--name-only"]
+    args.append("--no-renames")
+    if skip_deleted:
+        args.append("--diff-filter=d")
+    args.extend([from_ref, to_ref, "--"])
+
+    output = _git(
+        args, f"Unable to compute the changes between '{from_ref}' and '{to_ref}'"
+    )
+    for record in output.split("\0"):
+        if not record:
+            continue
+        path = record
+        if skip_binary:
+            # Every record is "<added>\t<deleted>\t<path>"
+            added, deleted, path = record.split("\t", 2)
+            if added == "-" and deleted == "-":
+                continue
+        if files_regex is not None and not re.match(files_regex, path):
+            continue
+        # git prints the paths relative to the git root
+        yield os.path.join(cdup, path)
+
+
+def get_changed_files(
+    from_ref: str | None,
+    to_ref: str = "HEAD",
+    skip_deleted: bool = True,
+    skip_binary: bool = True,
+    files_regex: str | None = None,
+) -> list[str] | None:
+    """
+    Returns the files changed in the range passed via CLI,
+    or None if the hook has not been invoked with --from-ref
+    """
+    if from_ref is None:
+        return None
+    return list(
+        iter_changed_files(from_ref, to_ref, skip_deleted, skip_binary, files_regex)
+    )
+
+
+def _git(args: list[str], error: str) -> str:
+    """Run git and return its output, exit printing error if it fails"""
+    import subprocess
+
+    process = subprocess.run(["git", *args], stdout=subprocess.PIPE)
+    if process.returncode != 0:
+        print(f"ERROR: {error}", file=sys.stderr)
+        sys.exit(1)
+    # fsdecode keeps non UTF-8 paths usable with open()
+    return os.fsdecode(process.stdout)
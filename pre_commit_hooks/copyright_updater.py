@@ -11,6 +11,8 @@ from functools import reduce
 from operator import concat
 from pathlib import Path
 
+from . import changed_files
+
 NEW_NOTICE = f" Copyright (c) 2014-{date.today().year} Zuru Tech HK Limited, All rights reserved."
 SUPPORTED_EXTENSIONS = ["h", "cpp", "cs", "py"]
 EXTENSIONS_REGEX = {
@@ -20,6 +22,9 @@ EXTENSIONS_REGEX = {
     "py": r"('''.*?''')|(\"\"\".*?\"\"\")|(#[^\n]*\n)",
 }
 EXTENSIONS_COMMENT = {"h": "//", "cpp": "//", "cs": "//", "py": "#"}
+# Unlike the "files" pattern in .pre-commit-hooks.yaml, .pyi files are left out:
+# main() only knows the comment syntax of SUPPORTED_EXTENSIONS
+FILES_REGEX = rf".*\.({'|'.join(SUPPORTED_EXTENSIONS)})$"
 
 
 def getArguments() -> argparse.Namespace:
@@ -37,8 +42,12 @@ def getArguments() -> argparse.Namespace:
     parser.add_argument(
         "--files", default=[], type=str, nargs="+", help="The list of files to update"
     )
+    parser.add_argument("--from-ref", default=None, help=changed_files.FROM_REF_HELP)
+    parser.add_argument("--to-ref", default=None, help=changed_files.TO_REF_HELP)
 
     args = parser.parse_args()
+    if args.to_ref is not None and args.from_ref is None:
+        parser.error("--to-ref requires --from-ref")
     return args
 
 
@@ -53,12 +62,20 @@ def getFileList(args: list[str]) -> list[str]:
     if len(args.files) > 0:
         fileList.extend(args.files)
 
+    changed = changed_files.get_changed_files(
+        args.from_ref, args.to_ref or "HEAD", files_regex=FILES_REGEX
+    )
+    if changed is not None:
+        fileList.extend(changed)
+
     return fileList
 
 
 def main() -> int:
     args = getArguments()
     fileList = getFileList(args)
+    if not fileList:
+        return 0
 
     empty_files = []
 
@@ -2,13 +2,21 @@
 
 """pre-commit hook that verifies if the .dc files passed are updated to the latest version"""
 import io
-import json
+import os
 import re
 import sys
 
+from . import changed_files
+
+# Same selection as the "files" pattern in .pre-commit-hooks.yaml
+FILES_REGEX = r".*\.dc$"
+EXP_STRUCTS_PATH = "Dreamcatcher/Plugins/BIMCore/Source/DCInterfaces/Public/Source/ExportData/ExpStructs.h"
+
 
 def verify_file(file_name, version):
     """Verifies if the .dc file schema is at the passed version"""
+    import json
+
     with io.open(file_name, "r", encoding="utf-8") as fp:
         dcfile = json.load(fp)
 
@@ -21,9 +29,14 @@ def verify_file(file_name, version):
 def main():
     """Entrypoint"""
 
+    dcfiles = changed_files.get_hook_files(sys.argv[1:], FILES_REGEX)
+    if not dcfiles:
+        # No file to check
+        return 0
+
     version = ""
     with io.open(
-        "Dreamcatcher/Plugins/BIMCore/Source/DCInterfaces/Public/Source/ExportData/ExpStructs.h",
+        os.path.join(changed_files.get_git_cdup(), EXP_STRUCTS_PATH),
         "r",
         encoding="utf-8",
     ) as fp:
@@ -39,14 +52,13 @@ def main():
         print("Unable to find DCFileVersion", file=sys.stderr)
         return 1
 
-    for dcfile in sys.argv[1:]:
-        if not dcfile.startswith("-"):
-            if not verify_file(dcfile, version):
-                print(
-                    f"{dcfile} not updated to the latest schema version: {version}",
-                    file=sys.stderr,
-                )
-                return 1
+    for dcfile in dcfiles:
+        if not verify_file(dcfile, version):
+            print(
+                f"{dcfile} not updated to the latest schema version: {version}",
+                file=sys.stderr,
+            )
+            return 1
     return 0
 
 
@@ -2,11 +2,15 @@ import re
 import sys
 import io
 
+from . import changed_files
+
+# Same selection as the "files" pattern in .pre-commit-hooks.yaml
+FILES_REGEX = r"^Dreamcatcher/Source/.*\.h$"
+
 
 def main():
-    for file in sys.argv[1:]:
-        if not file.startswith("-"):
-            verify_file(file)
+    for file in changed_files.get_hook_files(sys.argv[1:], FILES_REGEX):
+        verify_file(file)
 
 
 def verify_file(file_name):
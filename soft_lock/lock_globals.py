@@ -1,15 +1,10 @@
 # Copyright (c) 2014-2024 Zuru Tech HK Limited, All rights reserved.
 
-import glob
-import http.client
-import json
 import os
 import re
-import shutil
 import subprocess
 import sys
 import time
-import urllib.parse
 from pathlib import Path
 from typing import Iterator, List
 
@@ -54,6 +49,10 @@ def make_post(authorization, path, body, return_error=False) -> dict:
     :return: The response from the server
     :raises: NotAuthorizedError: In case of error 401
     """
+    # Imported here so hooks that never reach the backend don't pay for ssl
+    import http.client
+    import json
+
     try:
         print_verbose(f"requesting {path}")
         data = json.dumps(body)
@@ -96,6 +95,8 @@ def get_actual_filename(name: str) -> str:
     Find a file with the right cases (for case-insensitive file systems)
     If the file doesn't exists, return the string as is
     """
+    import glob
+
     result = glob.glob(f"{name[:-1]}[{name[-1]}]")
     return result[0] if len(result) > 0 else name
 
@@ -164,6 +165,8 @@ def get_git_root_from_dir(path) -> Path:
 
 
 def find_ssh():
+    import shutil
+
     ssh = os.getenv("GIT_SSH")
     if isinstance(ssh, str):
         return ssh
@@ -180,6 +183,8 @@ def find_ssh():
 def find_lfs_root(git_root=Path.cwd()):
     url = spawn(["git", "-C", str(git_root), "remote", "get-url", "origin"]).strip()
     if url.startswith("https://"):
+        import urllib.parse
+
         parsed = urllib.parse.urlparse(url)
         return parsed.path.lstrip("/")
     split = url.split("git@gitlab.com:")
@@ -202,6 +207,7 @@ def get_full_name():
 def find_authorization(repo_path) -> str:
     """Returns the authorization to use to communicate with the backend"""
     global g_user_data
+    import json
 
     # load cached zsl token
     home = get_app_home()
@@ -238,6 +244,8 @@ def get_gitlab_username() -> str:
 
 
 def _generate_lfs_authorization(repo_path):
+    import json
+
     ssh = find_ssh()
     print_verbose("generating GitLab token")
     json_auth = spawn(
@@ -259,11 +267,11 @@ def spawn(args: List, stdin=""):
     program = " ".join([str(it) for it in args])
     print_verbose("running " + program)
     process = subprocess.Popen(args, stdout=subprocess.PIPE, stdin=subprocess.PIPE)
-    output, _ = process.communicate(input=stdin.encode())
+    output, _ = process.communicate(input=os.fsencode(stdin))
     exit_code = process.wait()
     if exit_code != 0:
         _spawn_error(exit_code)
-    return output.decode()
+    return os.fsdecode(output)
 
 
 def filter_lockable_files(files):
@@ -1,11 +1,25 @@
 #!/usr/bin/env python
 
+import os
+import sys
+
+from pre_commit_hooks import changed_files
+
 from . import lock_globals
 
+OPTIONS = changed_files.RANGE_OPTIONS + ("--branch",)
 
-def get_modified_files():
+
+def get_modified_files(from_ref, to_ref):
     """Return the list of modified files."""
 
+    if from_ref is not None:
+        # Lockable assets are usually binary and deleting them requires the lock too
+        changed = changed_files.get_changed_files(
+            from_ref, to_ref, skip_deleted=False, skip_binary=False
+        )
+        return "\n".join(changed)
+
     if lock_globals.is_valid_ref("MERGE_HEAD"):
         # If this is a merge commit, check only conflicted files
         # Currently, conflicts which has been resolved by choosing one side or the other are not checked
@@ -25,10 +39,31 @@ def get_modified_files():
     ).strip()
 
 
+def get_pipeline_branch(branch):
+    """Return the branch to check in a pipeline, where HEAD is usually detached"""
+
+    if branch is not None:
+        return branch
+    if "CI_COMMIT_REF_NAME" not in os.environ:
+        print(
+            "ERROR: use --branch or CI_COMMIT_REF_NAME with --from-ref", file=sys.stderr
+        )
+        sys.exit(1)
+    return os.environ["CI_COMMIT_REF_NAME"]
+
+
 def main():
     """main entrypoint."""
 
-    files = lock_globals.filter_lockable_files(get_modified_files())
+    _, options = changed_files.parse_arguments(sys.argv[1:], OPTIONS)
+    from_ref = options["--from-ref"]
+    if from_ref is not None:
+        # The backend expects paths relative to the git root
+        os.chdir(lock_globals.get_git_root())
+
+    files = lock_globals.filter_lockable_files(
+        get_modified_files(from_ref, options["--to-ref"] or "HEAD")
+    )
     if not files:
         # No file to check
         exit(0)
@@ -36,12 +71,17 @@ def main():
     print("Checking:\n- %s" % "\n- ".join(files))
     git_root = lock_globals.get_git_root()
     repository = lock_globals.find_lfs_root()
+    if from_ref is not None:
+        branch = get_pipeline_branch(options["--branch"])
+        authorization = lock_globals.get_pipeline_secret()
+    else:
+        branch = options["--branch"] or lock_globals.get_upstream_branch(git_root)
+        authorization = lock_globals.find_authorization(repository)
     body = {
         "repository": repository,
         "files": files,
-        "branch": lock_globals.get_upstream_branch(git_root),
+        "branch": branch,
     }
-    authorization = lock_globals.find_authorization(repository)
     lock_globals.make_post(authorization, "/pre-commit", body)
 
     # no error means ok
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# -X importtime is noisy, the fastest of a few runs is compared to the budget
+RUNS = 5
+
+# The backend client is only needed once check_locks finds lockable files
+BACKEND_MODULES = {"ssl", "http.client", "json"}
+
+
+def import_time(module):
+    """
+    Import module with -X importtime
+    :return: the cumulative import time of module in µs and the modules it loaded
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    cumulative = None
+    modules = set()
+    for line in process.stderr.decode().splitlines():
+        # "import time: <self [us]> | <cumulative> | <imported package>"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        name = name.strip()
+        modules.add(name)
+        if name == module:
+            cumulative = int(cumulative_us)
+    assert cumulative is not None, f"{module} not found in -X importtime output"
+    return cumulative, modules
+
+
+@pytest.mark.parametrize(
+    ("module", "budget_us", "forbidden"),
+    (
+        ("soft_lock.pre_commit", 60_000, BACKEND_MODULES | {"argparse"}),
+        (
+            "pre_commit_hooks.copyright_updater",
+            50_000,
+            BACKEND_MODULES | {"subprocess"},
+        ),
+        (
+            "pre_commit_hooks.dcfiles_updated",
+            18_000,
+            BACKEND_MODULES | {"argparse", "subprocess", "typing"},
+        ),
+        (
+            "pre_commit_hooks.generated_header_separated",
+            18_000,
+            BACKEND_MODULES | {"argparse", "subprocess", "typing"},
+        ),
+    ),
+)
+def test_entry_point_imports(module, budget_us, forbidden):
+    results = [import_time(module) for _ in range(RUNS)]
+    best_us = min(cumulative for cumulative, _ in results)
+    assert best_us < budget_us, f"{module} imports in {best_us}µs"
+    assert results[0][1] & forbidden == set()